@@ -2,8 +2,17 @@ import streamlit as st
 import sqlite3
 import requests
 import pandas as pd
+import html
+import json
+import math
+import os
 import re
-from datetime import datetime
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from parsers import determine_status, parse_progress, parse_season_episodes
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # =========================================================
 # CONFIG
@@ -20,9 +29,39 @@ DROPBOX_DB_URL = (
 )
 
 LOCAL_DB = "Trakt_DBase.db"
+LOCAL_DB_META = LOCAL_DB + ".meta.json"
+# Verhogen bij elke wijziging in prepare_db
+DB_SCHEMA = 3
+# Hoe lang (s) een gecontroleerde DB geldig blijft zonder Dropbox te vragen
+DB_TTL = 600
 
 TMDB_API_KEY = st.secrets["TMDB_API_KEY"]
 TMDB_IMG_BASE = "https://image.tmdb.org/t/p/w300"
+POSTER_WORKERS = 8
+PAGE_SIZE = 20
+STATUS_LABELS = {
+    "Completed": "🟢 **Completed**",
+    "Watching": "🔵 **Watching**",
+    "Not started": "⚪ **Not started**",
+}
+TABLE_COLUMNS = [
+    "NAAM", "YEAR", "STATUS", "SEASON", "EPISODE", "LAST_SEEN",
+    "WATCHED", "TOTAL", "PERCENT", "UPDATED"
+]
+MIN_TERM_LENGTH = 2
+POSTER_TTL = 86400
+POSTER_DB = "tmdb_posters.db"
+
+# Eén sessie voor alle HTTP-verzoeken: hergebruik van TCP/TLS-verbindingen.
+# Pool even groot als het aantal poster-threads, zodat er geen verbindingen
+# worden weggegooid
+SESSION = requests.Session()
+SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_maxsize=POSTER_WORKERS)
+)
+
+# Zoektermen die veilig als FTS5-prefixquery kunnen
+_FTS_TERM_RE = re.compile(r"[^\W_]+(?: [^\W_]+)*")
 
 # =========================================================
 # GENRE NORMALISATIE
@@ -74,151 +113,396 @@ GENRE_CANONICAL = {
     "special-interest": "Special Interest",
 }
 
-GENRE_BLACKLIST = {
+GENRE_BLACKLIST = frozenset({
     "delete",
     "delete?",
     "delete!?",
     "selecteer genres...",
     ""
-}
+})
 
 # =========================================================
 # DOWNLOAD DB (CACHED)
 # =========================================================
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=DB_TTL)
 def download_db():
-    r = requests.get(DROPBOX_DB_URL, timeout=30)
-    r.raise_for_status()
-    with open(LOCAL_DB, "wb") as f:
-        f.write(r.content)
+    meta = load_db_meta() if os.path.exists(LOCAL_DB) else {}
+    # Ander schema (prepare_db gewijzigd) → altijd opnieuw downloaden en opbouwen
+    if meta.get("schema") != DB_SCHEMA:
+        meta = {}
+    # Binnen DB_TTL al gecontroleerd (bv. vóór een herstart): geen netwerk nodig
+    if time.time() - meta.get("checked_at", 0) < DB_TTL:
+        return LOCAL_DB
+
+    # Conditional GET: alleen opnieuw downloaden als Dropbox een nieuwe versie heeft
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    tmp = LOCAL_DB + ".part"
+    with SESSION.get(
+        DROPBOX_DB_URL, headers=headers, timeout=30, stream=True
+    ) as r:
+        if r.status_code == 304:
+            save_db_meta({**meta, "checked_at": time.time()})
+            return LOCAL_DB
+        r.raise_for_status()
+        # Direct van socket naar schijf; eerst naar .part zodat een afgebroken
+        # download of de index-opbouw nooit het bestaande bestand raakt
+        r.raw.decode_content = True
+        with open(tmp, "wb") as f:
+            shutil.copyfileobj(r.raw, f, length=1 << 20)
+        meta = {
+            "schema": DB_SCHEMA,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "checked_at": time.time(),
+        }
+
+    prepare_db(tmp)
+    os.replace(tmp, LOCAL_DB)
+    save_db_meta(meta)
     return LOCAL_DB
 
+def load_db_meta():
+    try:
+        with open(LOCAL_DB_META) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_db_meta(meta):
+    with open(LOCAL_DB_META, "w") as f:
+        json.dump(meta, f)
+
+def prepare_db(path):
+    # Eenmalig per download: zoekindexen en afgeleide kolommen
+    conn = sqlite3.connect(path)
+    try:
+        # NOCASE-index op NAAM voor de LIKE-zoekopdrachten
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_naam "
+            "ON tbl_Trakt(NAAM COLLATE NOCASE)"
+        )
+        # FTS5-index op NAAM, zodat zoeken geen full table scan meer is
+        try:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS trakt_fts USING fts5(
+                    NAAM, content='tbl_Trakt', content_rowid='rowid'
+                )
+                """
+            )
+            conn.execute("INSERT INTO trakt_fts(trakt_fts) VALUES('rebuild')")
+        except sqlite3.OperationalError:
+            # SQLite zonder FTS5: search_series valt terug op LIKE
+            pass
+
+        # Voortgang en WATCHED/TOTAL/PERCENT vooraf berekend, zodat
+        # zoekopdrachten PROGRESS/SEASONSEPISODES niet meer hoeven te parsen
+        raw = query_df(
+            conn,
+            "SELECT rowid AS ID, PROGRESS, SEASONSEPISODES FROM tbl_Trakt",
+            ()
+        )
+        derived = (
+            raw[["ID"]]
+            .join(parse_progress(raw["PROGRESS"]))
+            .join(parse_season_episodes(raw["SEASONSEPISODES"]))
+        )
+        conn.execute("DROP TABLE IF EXISTS trakt_agg")
+        conn.execute(
+            """
+            CREATE TABLE trakt_agg (
+                ID INTEGER PRIMARY KEY,
+                SEASON INTEGER,
+                EPISODE INTEGER,
+                PROG_DATE TEXT,
+                LAST_SEEN TEXT,
+                WATCHED INTEGER,
+                TOTAL INTEGER,
+                PERCENT REAL
+            )
+            """
+        )
+        derived.to_sql("trakt_agg", conn, if_exists="append", index=False)
+        conn.commit()
+    finally:
+        conn.close()
+
+# =========================================================
+# DATABASE CONNECTION (CACHED)
+# =========================================================
+@st.cache_resource(max_entries=1)
+def get_conn(path, version):
+    # version = mtime van het bestand: na een nieuwe download een nieuwe connectie.
+    # De hele DB (incl. FTS- en NAAM-index) wordt één keer naar het geheugen
+    # gekopieerd; zoekopdrachten raken daarna de schijf niet meer
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    src = sqlite3.connect(path)
+    try:
+        src.backup(conn)
+    finally:
+        src.close()
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+def open_db():
+    # (conn, version): version hoort in elke cache-key op rowid-data, zodat
+    # gecachete resultaten samen met de connectie vervallen
+    path = download_db()
+    version = os.path.getmtime(path)
+    return get_conn(path, version), version
+
 # =========================================================
 # TMDB POSTER (CACHED)
 # =========================================================
-@st.cache_data(ttl=86400)
+@st.cache_resource
+def get_poster_conn():
+    # Aparte cache-DB: Trakt_DBase.db wordt bij elke nieuwe versie vervangen
+    conn = sqlite3.connect(
+        POSTER_DB, check_same_thread=False, isolation_level=None
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS poster_cache (
+            tmdb_id INTEGER PRIMARY KEY,
+            url TEXT,
+            fetched_at INTEGER
+        )
+        """
+    )
+    return conn
+
+def load_cached_posters(tmdb_ids):
+    # Eén bulk-SELECT voor alle ids die nog niet verlopen zijn
+    if not tmdb_ids:
+        return {}
+    placeholders = ",".join("?" * len(tmdb_ids))
+    rows = get_poster_conn().execute(
+        f"""
+        SELECT tmdb_id, url FROM poster_cache
+        WHERE tmdb_id IN ({placeholders}) AND fetched_at > ?
+        """,
+        (*tmdb_ids, int(time.time()) - POSTER_TTL)
+    ).fetchall()
+    return dict(rows)
+
+@st.cache_data(ttl=POSTER_TTL)
 def get_tmdb_poster(tmdb_id):
     if not tmdb_id:
         return None
     try:
-        r = requests.get(
+        r = SESSION.get(
             f"https://api.themoviedb.org/3/tv/{tmdb_id}",
             params={"api_key": TMDB_API_KEY},
             timeout=10
         )
         r.raise_for_status()
         data = r.json()
-        poster_path = data.get("poster_path")
-        if poster_path:
-            return TMDB_IMG_BASE + poster_path
-    except Exception:
-        pass
-    return None
-
-# =========================================================
-# PARSERS
-# =========================================================
-def parse_progress(progress):
-    if not progress or progress.strip() == "#N/A":
-        return {"season": None, "episode": None, "date": None}
-
-    m = re.search(r"S(\d{2})E(\d{2})\s*←-→\s*(.+)", progress)
-    if not m:
-        return {"season": None, "episode": None, "date": None}
-
-    return {
-        "season": int(m.group(1)),
-        "episode": int(m.group(2)),
-        "date": m.group(3)
-    }
-
-def parse_season_episodes(value):
-    watched = 0
-    total = 0
-
-    if not value or value.strip() == "#N/A":
-        return watched, total, 0.0
-
-    for part in value.split("§"):
-        try:
-            w, t = part.split("/")
-            watched += int(w)
-            total += int(t)
-        except ValueError:
-            pass
-
-    percent = round((watched / total) * 100, 1) if total > 0 else 0.0
-    return watched, total, percent
-
-def determine_status(watched, total):
-    if total > 0 and watched == total:
-        return "Completed"
-    if watched > 0:
-        return "Watching"
-    return "Not started"
-
-def parse_date(date_str):
-    try:
-        return datetime.strptime(date_str, "%d-%m-%Y %H:%M:%S")
     except Exception:
         return None
 
+    poster_path = data.get("poster_path")
+    url = TMDB_IMG_BASE + poster_path if poster_path else None
+    get_poster_conn().execute(
+        "INSERT OR REPLACE INTO poster_cache VALUES (?, ?, ?)",
+        (tmdb_id, url, int(time.time()))
+    )
+    return url
+
+def get_tmdb_posters(tmdb_ids):
+    ids = list(dict.fromkeys(int(i) for i in tmdb_ids if pd.notna(i) and i))
+    posters = load_cached_posters(ids)
+    missing = [i for i in ids if i not in posters]
+
+    # Ontbrekende posters parallel ophalen i.p.v. één request per rij na elkaar.
+    # Script-context doorgeven, anders klaagt st.cache_data in de worker-threads
+    with ThreadPoolExecutor(
+        max_workers=POSTER_WORKERS,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    ) as ex:
+        posters.update(zip(missing, ex.map(get_tmdb_poster, missing)))
+    return posters
+
 # =========================================================
 # GENRES → BADGES
 # =========================================================
+GENRE_BADGE_PREFIX = (
+    '<span style="'
+    'display:inline-block;'
+    'background:#eef2f7;'
+    'color:#333;'
+    'padding:4px 10px;'
+    'margin:2px 6px 2px 0;'
+    'border-radius:12px;'
+    'font-size:0.8rem;'
+    'white-space:nowrap;'
+    '">'
+)
+GENRE_BADGE_SUFFIX = "</span>"
+
+# Beide functies zijn puur; dezelfde GENRE-tekst komt bij veel series terug
+@lru_cache(maxsize=4096)
 def normalize_genres(raw):
-    if not raw:
-        return []
-    result = []
+    if not isinstance(raw, str) or not raw:
+        return ()
+    # dict als geordende set: O(1) dubbel-check, volgorde blijft behouden
+    result = {}
     for g in [x.strip() for x in raw.split(",")]:
         key = g.lower()
         if key in GENRE_BLACKLIST:
             continue
-        canon = GENRE_CANONICAL.get(key, g.title())
-        if canon not in result:
-            result.append(canon)
-    return result
+        canon = GENRE_CANONICAL.get(key) or g.title()
+        result[canon] = None
+    return tuple(result)
 
+@lru_cache(maxsize=4096)
 def render_genre_badges(raw):
     genres = normalize_genres(raw)
     if not genres:
         return ""
-    html = ""
-    for g in genres:
-        html += (
-            '<span style="'
-            'display:inline-block;'
-            'background:#eef2f7;'
-            'color:#333;'
-            'padding:4px 10px;'
-            'margin:2px 6px 2px 0;'
-            'border-radius:12px;'
-            'font-size:0.8rem;'
-            'white-space:nowrap;'
-            '">'
-            f'{g}</span>'
-        )
-    return f'<div style="margin-top:6px;">{html}</div>'
+    badges = "".join(GENRE_BADGE_PREFIX + g + GENRE_BADGE_SUFFIX for g in genres)
+    return f'<div style="margin-top:6px;">{badges}</div>'
 
 # =========================================================
 # DATABASE QUERY
 # =========================================================
-def search_series(term):
-    conn = sqlite3.connect(download_db())
-    df = pd.read_sql_query(
-        """
-        SELECT
-            NAAM, YEAR, PLOT, GENRE, TMDB_ID,
-            PROGRESS, SEASONSEPISODES, UPDATED
-        FROM tbl_Trakt
-        WHERE NAAM LIKE ?
-        """,
-        conn,
-        params=(f"%{term}%",)
+# Zonder PLOT: die wordt pas opgehaald als iemand hem wil lezen (get_plot)
+SEARCH_COLUMNS = """
+    t.rowid AS ID, t.NAAM, t.YEAR, t.GENRE, t.TMDB_ID,
+    a.SEASON, a.EPISODE, a.PROG_DATE, a.LAST_SEEN,
+    a.WATCHED, a.TOTAL, a.PERCENT, t.UPDATED
+"""
+
+def query_df(conn, query, params):
+    # Rechtstreeks via de cursor: schema is bekend, read_sql_query is overkill
+    cur = conn.execute(query, params)
+    columns = [d[0] for d in cur.description]
+    return pd.DataFrame.from_records(cur.fetchall(), columns=columns)
+
+def apply_dtypes(df):
+    # Juiste en zo klein mogelijke dtypes: minder geheugen, snellere sort/filter
+    df["YEAR"] = pd.to_numeric(df["YEAR"], errors="coerce").astype("Int16")
+    df["TMDB_ID"] = pd.to_numeric(df["TMDB_ID"], errors="coerce").astype("Int32")
+    df["GENRE"] = df["GENRE"].astype("category")
+    df["SEASON"] = pd.to_numeric(df["SEASON"]).astype("Int16")
+    df["EPISODE"] = pd.to_numeric(df["EPISODE"]).astype("Int16")
+    # trakt_agg bewaart LAST_SEEN als ISO-tekst
+    df["LAST_SEEN"] = pd.to_datetime(df["LAST_SEEN"], format="%Y-%m-%d %H:%M:%S")
+    return df
+
+def add_display_columns(df):
+    df["STATUS"] = determine_status(df["WATCHED"], df["TOTAL"])
+    # Statusregel en progress-waarde per kolom i.p.v. per rij in de render-lus
+    df["PROGRESS_FRAC"] = df["PERCENT"] / 100
+    df["SUMMARY_MD"] = (
+        "⏳ **" + (df["TOTAL"] - df["WATCHED"]).clip(lower=0).astype(str)
+        + " left** &nbsp;&nbsp; 📊 **"
+        + df["WATCHED"].astype(str) + " / " + df["TOTAL"].astype(str)
+        + " (" + df["PERCENT"].astype(str) + "%)**"
     )
-    conn.close()
     return df
 
+# Gecachet inclusief alle afgeleide kolommen: de UI hoeft alleen nog te renderen
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def search_series(term, anywhere, version):
+    # version alleen als cache-key: ID (rowid) is alleen geldig binnen één DB-versie
+    conn, _ = open_db()
+    df = None
+    # Alleen gewone woorden via FTS; leestekens e.d. via LIKE
+    if not anywhere and _FTS_TERM_RE.fullmatch(term):
+        try:
+            df = query_df(
+                conn,
+                f"""
+                SELECT {SEARCH_COLUMNS}
+                FROM trakt_fts f
+                JOIN tbl_Trakt t ON t.rowid = f.rowid
+                JOIN trakt_agg a ON a.ID = t.rowid
+                WHERE trakt_fts MATCH ?
+                """,
+                (f'"{term}"*',)
+            )
+        except sqlite3.OperationalError:
+            pass
+
+    if df is None:
+        # 'term%' kan via idx_naam (range scan); '%term%' is altijd een full scan
+        pattern = f"%{term}%" if anywhere else f"{term}%"
+        df = query_df(
+            conn,
+            f"""
+            SELECT {SEARCH_COLUMNS}
+            FROM tbl_Trakt t
+            JOIN trakt_agg a ON a.ID = t.rowid
+            WHERE t.NAAM LIKE ?
+            """,
+            (pattern,)
+        )
+    return add_display_columns(apply_dtypes(df))
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_plot(series_id, version):
+    conn, _ = open_db()
+    row = conn.execute(
+        "SELECT PLOT FROM tbl_Trakt WHERE rowid = ?", (series_id,)
+    ).fetchone()
+    return row[0] if row else None
+
+# =========================================================
+# UI – RESULT CARD
+# =========================================================
+def render_card(row, poster_url, version):
+    status = row.STATUS
+    with st.container(border=True):
+        col1, col2 = st.columns([1, 2])
+
+        # POSTER
+        with col1:
+            if poster_url:
+                st.image(poster_url, use_container_width=True)
+
+        # INFO: titel, status, laatst gezien en statusregel in één markdown-blok
+        with col2:
+            # unsafe_allow_html is alleen nodig voor SUMMARY_MD: DB-tekst escapen
+            info = [
+                f"### {html.escape(str(row.NAAM))} ({row.YEAR})",
+                STATUS_LABELS[status]
+            ]
+
+            if status == "Watching" and pd.notna(row.SEASON):
+                seen = (
+                    row.LAST_SEEN.strftime("%d-%m-%Y %H:%M")
+                    if pd.notna(row.LAST_SEEN) else html.escape(row.PROG_DATE)
+                )
+                info.append(
+                    f"👁️ **Laatst gezien:** "
+                    f"S{row.SEASON:02d}E{row.EPISODE:02d} · {seen}"
+                )
+
+            # -------- COMPACTE STATUSREGEL (FIX)
+            info.append(row.SUMMARY_MD)
+            st.markdown("\n\n".join(info), unsafe_allow_html=True)
+
+            # Progress bar eronder
+            st.progress(row.PROGRESS_FRAC)
+
+        # DETAILS
+        with st.expander("Details", expanded=True):
+            st.markdown(
+                render_genre_badges(row.GENRE),
+                unsafe_allow_html=True
+            )
+
+            if st.toggle("Plot", key=f"plot_{row.ID}"):
+                st.write(get_plot(row.ID, version) or "No plot available.")
+
+            st.caption(f"Last updated: {row.UPDATED}")
+
 # =========================================================
 # UI – TITLE
 # =========================================================
@@ -233,69 +517,87 @@ st.markdown(
 )
 
 zoekterm = st.text_input("Search series:")
+anywhere = st.checkbox("Match anywhere in the title")
+
+with st.sidebar:
+    if st.button("Clear cache"):
+        st.cache_data.clear()
 
 # =========================================================
 # UI – RESULTS
 # =========================================================
-if zoekterm.strip():
-    df = search_series(zoekterm)
-
-    for _, row in df.iterrows():
-        watched, total, percent = parse_season_episodes(row["SEASONSEPISODES"])
-        status = determine_status(watched, total)
-        episodes_left = max(total - watched, 0)
-
-        prog = parse_progress(row["PROGRESS"])
-        last_seen_dt = parse_date(prog["date"])
-        poster_url = get_tmdb_poster(row["TMDB_ID"])
-
-        with st.container(border=True):
-            col1, col2 = st.columns([1, 2])
-
-            # POSTER
-            with col1:
-                if poster_url:
-                    st.image(poster_url, use_container_width=True)
-
-            # INFO
-            with col2:
-                st.subheader(f"{row['NAAM']} ({row['YEAR']})")
-
-                st.markdown(
-                    "🟢 **Completed**" if status == "Completed"
-                    else "🔵 **Watching**" if status == "Watching"
-                    else "⚪ **Not started**"
-                )
+# Eén letter levert vooral brede resultaten op; pas vanaf MIN_TERM_LENGTH zoeken
+if 0 < len(zoekterm.strip()) < MIN_TERM_LENGTH:
+    st.info(f"Type at least {MIN_TERM_LENGTH} characters to search.")
+    st.stop()
 
-                if status == "Watching" and prog["season"] is not None:
-                    seen = (
-                        last_seen_dt.strftime("%d-%m-%Y %H:%M")
-                        if last_seen_dt else prog["date"]
-                    )
-                    st.markdown(
-                        f"👁️ **Laatst gezien:** "
-                        f"S{prog['season']:02d}E{prog['episode']:02d} · {seen}"
-                    )
-
-                # -------- COMPACTE STATUSREGEL (FIX)
-                status_line = (
-                    f"⏳ **{episodes_left} left** &nbsp;&nbsp; "
-                    f"📊 **{watched} / {total} ({percent}%)**"
-                )
-                st.markdown(status_line, unsafe_allow_html=True)
-
-                # Progress bar eronder
-                st.progress(percent / 100)
-
-            # DETAILS
-            with st.expander("Details", expanded=True):
-                st.markdown(
-                    render_genre_badges(row["GENRE"]),
-                    unsafe_allow_html=True
-                )
-
-                if row["PLOT"]:
-                    st.markdown("**Plot:**")
-                    st.write(row["PLOT"])
-
-                st.caption(f"Last updated: {row['UPDATED']}")
+if zoekterm.strip():
+    # Geen .lower(): LIKE en NOCASE negeren alleen ASCII-hoofdletters, "Élite"
+    # moet als "Élite" de query in (FTS5/unicode61 vouwt zelf al)
+    _, db_version = open_db()
+    df = search_series(zoekterm.strip(), anywhere, db_version)
+
+    col_sort, col_view, col_page = st.columns([2, 1, 1])
+    with col_sort:
+        sort_by = st.selectbox("Sort by", ["Status", "Name", "Year"])
+    with col_view:
+        view_mode = st.selectbox("View", ["Cards", "Table"])
+    if sort_by == "Status":
+        # STATUS is geordend: kijken, niet begonnen, afgerond;
+        # binnen een status het laatst gekeken bovenaan
+        df = df.sort_values(
+            ["STATUS", "LAST_SEEN"], ascending=[True, False], kind="stable"
+        )
+    elif sort_by == "Name":
+        df = df.sort_values(
+            "NAAM", key=lambda s: s.str.lower(), kind="stable"
+        )
+    else:
+        df = df.sort_values("YEAR", ascending=False, kind="stable")
+
+    if view_mode == "Table":
+        # Eén st.dataframe voor alle resultaten i.p.v. een container per rij;
+        # de volledige kaart alleen voor de geselecteerde rij
+        event = st.dataframe(
+            df[TABLE_COLUMNS],
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config={
+                "NAAM": "Title",
+                "YEAR": st.column_config.NumberColumn("Year", format="%d"),
+                "STATUS": "Status",
+                "SEASON": "Season",
+                "EPISODE": "Episode",
+                "LAST_SEEN": st.column_config.DatetimeColumn(
+                    "Last seen", format="DD-MM-YYYY HH:mm"
+                ),
+                "WATCHED": "Watched",
+                "TOTAL": "Total",
+                "PERCENT": st.column_config.ProgressColumn(
+                    "Progress", format="%.1f%%", min_value=0, max_value=100
+                ),
+                "UPDATED": "Last updated",
+            }
+        )
+        st.caption(f"{len(df)} results · select a row for details")
+        selected = df.iloc[event.selection.rows[:1]]
+        posters = get_tmdb_posters(selected["TMDB_ID"])
+        for row in selected.itertuples(index=False):
+            render_card(row, posters.get(row.TMDB_ID), db_version)
+
+    else:
+        # Alleen de huidige pagina renderen: ~20 containers i.p.v. honderden
+        pages = max(1, math.ceil(len(df) / PAGE_SIZE))
+        with col_page:
+            page = st.number_input(
+                "Page", min_value=1, max_value=pages, value=1,
+                disabled=pages == 1
+            )
+        view = df.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        st.caption(f"{len(df)} results · page {page} of {pages}")
+
+        posters = get_tmdb_posters(view["TMDB_ID"])
+
+        for row in view.itertuples(index=False):
+            render_card(row, posters.get(row.TMDB_ID), db_version)
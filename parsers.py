@@ -0,0 +1,68 @@
+import pandas as pd
+import numpy as np
+import re
+from functools import lru_cache
+
+# Sorteervolgorde van de statussen
+STATUS_ORDER = ["Watching", "Not started", "Completed"]
+
+# Voortgang zoals "S02E05 ←-→ 12-03-2024 21:14:00"
+_PROGRESS_RE = re.compile(r"S(\d{2})E(\d{2})\s*←-→\s*(.+)")
+
+# =========================================================
+# PARSERS
+# =========================================================
+def parse_progress(progress):
+    # Hele PROGRESS-kolom in één keer → SEASON, EPISODE, PROG_DATE, LAST_SEEN
+    parts = progress.str.extract(_PROGRESS_RE)
+    parts.columns = ["SEASON", "EPISODE", "PROG_DATE"]
+    parts["SEASON"] = pd.to_numeric(parts["SEASON"]).astype("Int64")
+    parts["EPISODE"] = pd.to_numeric(parts["EPISODE"]).astype("Int64")
+    # Ongeldige datums → NaT; PROG_DATE blijft als tekst voor de weergave
+    parts["LAST_SEEN"] = pd.to_datetime(
+        parts["PROG_DATE"], format="%d-%m-%Y %H:%M:%S", errors="coerce"
+    )
+    return parts
+
+@lru_cache(maxsize=8192)
+def _season_episode_totals(value):
+    watched = 0
+    total = 0
+    for part in value.split("§"):
+        try:
+            w, t = part.split("/")
+            watched += int(w)
+            total += int(t)
+        except ValueError:
+            pass
+    return watched, total
+
+def parse_season_episodes(value):
+    # "8/8§3/10" per rij → WATCHED, TOTAL, PERCENT; ongeldige delen tellen niet mee.
+    # Gewone Python-lus met cache: sneller dan split/explode/extract in pandas
+    totals = np.array(
+        [_season_episode_totals(v if isinstance(v, str) else "") for v in value],
+        dtype="int64"
+    ).reshape(-1, 2)
+
+    result = pd.DataFrame(
+        totals, index=value.index, columns=["WATCHED", "TOTAL"]
+    )
+    result["PERCENT"] = (
+        (result["WATCHED"] / result["TOTAL"] * 100)
+        .round(1)
+        .where(result["TOTAL"] > 0, 0.0)
+    )
+    return result
+
+def determine_status(watched, total):
+    status = np.select(
+        [(total > 0) & (watched == total), watched > 0],
+        ["Completed", "Watching"],
+        default="Not started"
+    )
+    # Geordende categorie: klein in geheugen en sorteert in STATUS_ORDER
+    return pd.Series(
+        pd.Categorical(status, categories=STATUS_ORDER, ordered=True),
+        index=watched.index
+    )